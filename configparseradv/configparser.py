@@ -1,48 +1,143 @@
 """An advanced version of the `ConfigParser` class."""
 import configparser as cparser
-
-import astropy.units as u
-import numpy as np
+from types import MappingProxyType
+from typing import Any, Dict, Optional, Tuple
 
 from .converters import (astropy_converter, list_converter, intlist_converter,
-                         floatlist_converter, path_converter,
+                         floatlist_converter, floatarray_converter,
+                         path_converter, quantity_converter,
                          skycoord_converter)
 
+_TRUE = frozenset({'1', 'yes', 'true', 'on'})
+_FALSE = frozenset({'0', 'no', 'false', 'off'})
+
 def get_boolean(value) -> bool:
     """Convert `value` to boolean as defined in `configparser`."""
-    if value.strip().lower() in ['1', 'yes', 'true', 'on']:
+    aux = value.strip().lower()
+    if aux in _TRUE:
         return True
-    elif value.strip().lower() in ['0', 'no', 'false', 'off']:
+    elif aux in _FALSE:
         return False
     else:
         raise ValueError(f'Cannot convert to boolean: {value}')
 
+# Marks values not found by getvalue
+_MISSING = object()
+
+def _convert(value, dtype):
+    """Convert `value` to `dtype` for `getvalue`."""
+    if dtype is None or value is None:
+        return value
+    else:
+        try:
+            if dtype == bool:
+                return get_boolean(value)
+            else:
+                return dtype(value)
+        except TypeError:
+            return astropy_converter(value, dtype)
+
+# Default converters
+_CONVERTERS = MappingProxyType({
+    'list': list_converter,
+    'intlist': intlist_converter,
+    'floatlist': floatlist_converter,
+    'floatarray': floatarray_converter,
+    'path': path_converter,
+    'skycoord': skycoord_converter,
+})
+
 class ConfigParserAdv(cparser.ConfigParser):
     """Extend the `configparser.ConfigParser` behaviour."""
 
     def __init__(self, **kwargs):
-        converters = {
-            'list': list_converter, 
-            'intlist': intlist_converter,
-            'floatlist': floatlist_converter, 
-            'path': path_converter,
-            'skycoord': skycoord_converter,
-        }
+        converters = dict(_CONVERTERS)
         try:
             converters.update(kwargs.pop('converters'))
         except KeyError:
             pass
         interpolation = kwargs.pop('interpolation',
                                    cparser.ExtendedInterpolation())
+
+        # Caches of interpolated and converted values. These need to exist
+        # before the parent initialization since defaults are stored with set
+        self._get_cache: Dict[Tuple, Any] = {}
+        self._value_cache: Dict[Tuple, Any] = {}
         super().__init__(converters=converters,
                          interpolation=interpolation,
                          **kwargs)
 
+    def clear_cache(self):
+        """Empty the caches of values read from the parser."""
+        self._get_cache.clear()
+        self._value_cache.clear()
+
+    def set(self, section, option, value=None):
+        self.clear_cache()
+        super().set(section, option, value=value)
+
+    def add_section(self, section):
+        self.clear_cache()
+        super().add_section(section)
+
+    def remove_option(self, section, option):
+        self.clear_cache()
+        return super().remove_option(section, option)
+
+    def remove_section(self, section):
+        self.clear_cache()
+        return super().remove_section(section)
+
+    def read(self, filenames, encoding=None):
+        self.clear_cache()
+        return super().read(filenames, encoding=encoding)
+
+    def read_file(self, f, source=None):
+        self.clear_cache()
+        super().read_file(f, source=source)
+
+    def read_string(self, string, source='<string>'):
+        self.clear_cache()
+        super().read_string(string, source=source)
+
+    def read_dict(self, dictionary, source='<dict>'):
+        self.clear_cache()
+        super().read_dict(dictionary, source=source)
+
+    def get(self, section, option, *, raw=False, vars=None,
+            fallback=cparser._UNSET):
+        """Get an option value for a given section.
+
+        Interpolated values are cached until the parser data is modified.
+        Input parameters are the same as for ``ConfigParser.get``.
+        """
+        # Raw values and values with vars are not cached
+        if raw or vars is not None:
+            return super().get(section, option, raw=raw, vars=vars,
+                               fallback=fallback)
+
+        key = (section, self.optionxform(option))
+        try:
+            return self._get_cache[key]
+        except KeyError:
+            pass
+        try:
+            value = super().get(section, option)
+        except (cparser.NoSectionError, cparser.NoOptionError):
+            if fallback is cparser._UNSET:
+                raise
+            return fallback
+        self._get_cache[key] = value
+
+        return value
+
     def getquantity(self, *args, **kwargs):
         """Return an ``astropy.Quantity`` from the parser data.
 
         Input parameters are the same as for ``parser.get(*args,**kwargs)``.
         """
+        import astropy.units as u
+
         val = self.get(*args, **kwargs)
 
         # If the value was changed then it may be already a quantity
@@ -52,35 +147,20 @@ class ConfigParserAdv(cparser.ConfigParser):
             # Or it may be a dimensionless float or float array
             try:
                 # Set dimenssionless unit
-                return (val + 0) * u.Unit(1)
+                return (val + 0) * u.dimensionless_unscaled
             except TypeError:
                 pass
 
-        # Fallback values
-        if val is None or len(val) == 0:
-            return val
-        else:
-            val = val.split()
-
-        # Convert string to quantity
-        if len(val) == 1:
-            # Dimesionless
-            return float(val[0]) * u.Unit(1)
-        elif len(val) == 2:
-            # Single quantity
-            return float(val[0]) * u.Unit(val[1])
-        else:
-            # Array of values
-            if val[-1].strip() in ['dimless', 'dimensionless', 'nounit', '1']:
-                unit = u.dimensionless_unscaled
-            else:
-                unit = u.Unit(val[-1])
-            return np.array(val[:-1], dtype=float) * unit
+        return quantity_converter(val)
 
-    def getvalue(self, *args, **kwargs):
+    def getvalue(self, section: str, key: str, fallback: Any = None,
+                 n: Optional[int] = None, sep: str = ' ',
+                 dtype: Any = None, allow_global: bool = True):
         """Get values and convert if needed.
         
         Args:
+          section: configuration file section.
+          key: section option to read.
           fallback: optional; default value.
           n: optional; if several values return value n.
           sep: optional; separator between values.
@@ -89,32 +169,41 @@ class ConfigParserAdv(cparser.ConfigParser):
           allow_global: optional; if one value is given but n!=0 use this value
             as default.
         """
-        # Options
-        opts = {
-            'fallback': None, 
-            'n': None, 
-            'sep': ' ', 
-            'dtype': None,
-            'allow_global': True,
-        }
-        opts.update(kwargs)
-
-        # Abbreviations
-        n = int(opts['n'])
-        key = args[1]
-        getkw = {'fallback':opts['fallback']}
-
-        # Get values
-        subkey = f'{key}{n}'
-        if n is not None and subkey in self.options(args[0]):
-            value = self.get(args[0], subkey, **getkw)
-        elif key in self.options(args[0]):
-            value = self.get(*args, **getkw)
+        # Unknown sections are not cached
+        if (section not in self._sections and
+            section != self.default_section):
+            raise cparser.NoSectionError(section)
+
+        # Value string, cached without the fallback and conversion
+        if n is not None:
+            n = int(n)
+        cache_key = (section, key, n, sep, allow_global)
+        try:
+            value = self._value_cache[cache_key]
+        except KeyError:
+            value = self._getvalue(section, key, n, sep, allow_global)
+            self._value_cache[cache_key] = value
+        if value is _MISSING:
+            value = fallback
+
+        # Strip spaces
+        if isinstance(value, str):
+            value = value.strip()
+
+        return _convert(value, dtype)
+
+    def _getvalue(self, section: str, key: str, n: Optional[int], sep: str,
+                  allow_global: bool):
+        """Get the value string or `_MISSING` if it is not available."""
+        if n is not None and self.has_option(section, f'{key}{n}'):
+            value = self.get(section, f'{key}{n}')
+        elif self.has_option(section, key):
+            value = self.get(section, key)
             if n is not None:
-                value = value.split(opts['sep'])
+                value = value.split(sep)
                 if len(value) == 1:
-                    if n != 0 and not opts['allow_global']:
-                        value = opts['fallback']
+                    if n != 0 and not allow_global:
+                        value = _MISSING
                     else:
                         value = value[0]
                 else:
@@ -123,43 +212,49 @@ class ConfigParserAdv(cparser.ConfigParser):
                     except IndexError:
                         print(f'WARNING: {key} not in values list,' + \
                               ' using fallback')
-                        value = opts['fallback']
+                        value = _MISSING
         else:
-            value = opts['fallback']
+            value = _MISSING
 
-        # Strip spaces
-        try:
-            value = value.strip()
-        except AttributeError:
-            pass
+        return value
 
-        # Convert
-        if opts['dtype'] is None or value is None:
-            return value
-        else:
-            try:
-                if opts['dtype'] == bool:
-                    return get_boolean(value)
-                else:
-                    return opts['dtype'](value)
-            except TypeError:
-                return astropy_converter(value, opts['dtype'])
-
-    def getvalueiter(self, *args, **kwargs):
+    def getvalueiter(self, section: str, key: str, sep: str = ' ',
+                     dtype: Any = None, **kwargs):
         """Iterator over velues in option.
+
+        Values are read from the options `key0`, `key1`, ... or from the
+        values in option `key`.
         
         Args:
+          section: configuration file section.
+          key: section option to read.
           sep: optional; value separator.
+          dtype: optional; type for conversion (see `getvalue`).
+          kwargs: optional; other `getvalue` options are ignored.
         """
-        opts = {'sep':kwargs.get('sep', ' '), 'n':0, 'allow_global':False}
-        while self.getvalue(*args, **opts):
-            kwargs['n'] = opts['n']
-            value = self.getvalue(*args, **kwargs)
-            if value is not None:
-                yield value
+        options = self._unify_values(section, None)
+        prefix = self.optionxform(key)
+        if prefix in options:
+            values = self.get(section, key).split(sep)
+        else:
+            values = []
+
+        # Stop at the first missing value
+        n = 0
+        while True:
+            subkey = f'{prefix}{n}'
+            if subkey in options:
+                value = self.get(section, subkey)
+            elif n < len(values):
+                value = values[n]
             else:
                 break
-            opts['n'] = opts['n'] + 1
+            if isinstance(value, str):
+                value = value.strip()
+            if value is None or value == '':
+                break
+            yield _convert(value, dtype)
+            n += 1
 
     def copy_section(self, section: str, new_section: str,
                      ignore_default: bool = False):
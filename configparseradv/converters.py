@@ -1,35 +1,25 @@
-"""Converters for `get` attributes of parser."""
-from pathlib import Path
-
-from astropy.coordinates import SkyCoord
-import astropy.units as u
-import numpy as np
+"""Converters for `get` attributes of parser.
 
-def splitter_decorator(dtype: None = None, min_length: int = 1):
-    """Split the input value and convert it to dtype
-    """
-    def decorator(funct):
-        def wrapper(val: str, sep: str = ' '):
-            # Check
-            if val is None:
-                return val
-
-            # Split value
-            aux = funct(val, sep=sep)
+The `astropy` and `numpy` modules are imported by the converters that need
+them, so loading the parser does not pay for their import.
+"""
+from functools import lru_cache
+from pathlib import Path
 
-            # Convert
-            if dtype is not None:
-                aux = list(map(dtype, aux))
+@lru_cache(maxsize=256)
+def _unit(val) -> 'astropy.units.Unit':
+    """Return the `astropy.units.Unit` of `val` and cache it."""
+    import astropy.units as u
+    return u.Unit(val)
 
-            # Check length
-            if min_length <= 0 and len(aux) == 1:
-                aux = aux[0]
-            elif len(aux) < min_length:
-                raise ValueError('Value length smaller than accepted')
+@lru_cache(maxsize=128)
+def _skycoord(ra: str, dec: str, frame: str) -> 'astropy.coordinates.SkyCoord':
+    """Return the `astropy.coordinates.SkyCoord` of the input and cache it.
 
-            return aux
-        return wrapper
-    return decorator
+    The cached object is shared, so the converters return a copy of it.
+    """
+    from astropy.coordinates import SkyCoord
+    return SkyCoord(ra, dec, frame=frame)
 
 def coma_splitter(val: str, sep: str = None) -> list:
     if ',' in val:
@@ -41,17 +31,44 @@ def coma_splitter(val: str, sep: str = None) -> list:
 
     return aux
 
-@splitter_decorator()
 def list_converter(val: str, sep: str = ' '):
+    """Split the input value."""
+    if val is None:
+        return val
+
     return val.split(sep)
 
-@splitter_decorator(dtype=int)
-def intlist_converter(val: str, sep: str = None):
-    return coma_splitter(val, sep=sep)
+def intlist_converter(val: str, sep: str = ' '):
+    """Split the input value and convert it to int."""
+    if val is None:
+        return val
+    aux = list(map(int, coma_splitter(val, sep=sep)))
+    if len(aux) < 1:
+        raise ValueError('Value length smaller than accepted')
+
+    return aux
+
+def floatlist_converter(val: str, sep: str = ' '):
+    """Split the input value and convert it to float."""
+    if val is None:
+        return val
+    aux = list(map(float, coma_splitter(val, sep=sep)))
+    if len(aux) < 1:
+        raise ValueError('Value length smaller than accepted')
+
+    return aux
+
+def floatarray_converter(val: str, sep: str = ' ') -> 'numpy.ndarray':
+    """Split the input value and convert it to a float array."""
+    import numpy as np
 
-@splitter_decorator(dtype=float)
-def floatlist_converter(val: str, sep: str = None):
-    return coma_splitter(val, sep=sep)
+    if val is None:
+        return val
+    aux = coma_splitter(val, sep=sep)
+    if len(aux) < 1:
+        raise ValueError('Value length smaller than accepted')
+
+    return np.fromiter(aux, dtype=np.float64, count=len(aux))
 
 def path_converter(val):
     if val is None:
@@ -65,7 +82,54 @@ def skycoord_converter(val):
         return val
     else:
         ra, dec, frame = val.split()
-        return SkyCoord(ra, dec, frame=frame)
+        return _skycoord(ra, dec, frame).copy()
+
+def quantity_converter(val: str) -> 'astropy.units.Quantity':
+    """Convert a string with values and unit to an `astropy` quantity.
+
+    A single value without unit is dimensionless. The unit of value arrays
+    can be `dimless`, `dimensionless`, `nounit` or `1` for dimensionless
+    arrays. Parsed values are cached, a copy of the cached quantity is
+    returned.
+    """
+    # Fallback values
+    if val is None or len(val) == 0:
+        return val
+
+    return _parse_quantity(val).copy()
+
+@lru_cache(maxsize=512)
+def _parse_quantity(val: str) -> 'astropy.units.Quantity':
+    """Convert a non-empty string to an `astropy` quantity and cache it."""
+    import astropy.units as u
+    import numpy as np
+
+    # Single quantity without splitting all the values
+    head, _, tail = val.rpartition(' ')
+    if tail:
+        try:
+            value = float(head)
+        except ValueError:
+            pass
+        else:
+            return u.Quantity(value, _unit(tail))
+    aux = val.split()
+
+    # Convert string to quantity
+    if len(aux) == 1:
+        # Dimesionless
+        return u.Quantity(float(aux[0]), u.dimensionless_unscaled)
+    elif len(aux) == 2:
+        # Single quantity
+        return u.Quantity(float(aux[0]), _unit(aux[1]))
+    else:
+        # Array of values
+        if aux[-1] in ['dimless', 'dimensionless', 'nounit', '1']:
+            unit = u.dimensionless_unscaled
+        else:
+            unit = _unit(aux[-1])
+        values = np.fromiter(aux[:-1], dtype=np.float64, count=len(aux) - 1)
+        return u.Quantity(values, unit, copy=False)
 
 def astropy_converter(val: str, dtype: str):
     """Convert to an astropy type
@@ -83,19 +147,13 @@ def astropy_converter(val: str, dtype: str):
         NotImplementedError: if dtype is not available
     """
     if dtype.lower() == 'quantity':
-        aux = val.split()
-        if len(aux) < 2:
-            return float(aux[0]) * u.dimensionless_unscaled
-        elif len(aux) == 2:
-            return float(aux[0]) * u.Unit(aux[1])
-        else:
-            return np.array(aux[:-1], dtype=float) * u.Unit(aux[-1])
+        return quantity_converter(val)
     elif dtype.lower() == 'skycoord':
         try:
             ra, dec, frame = val.split()
         except ValueError:
             ra, dec = val.split()
             frame = 'icrs'
-        return SkyCoord(ra, dec, frame=frame)
+        return _skycoord(ra, dec, frame).copy()
     else:
         raise NotImplementedError(f'Converter to {dtype} not available')
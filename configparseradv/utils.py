@@ -1,9 +1,24 @@
 """Utilities for working with `ConfigParserAdv` objects"""
 from typing import List, Sequence, Optional, Union
+import configparser as cparser
 
 Parser = Union['configparseradv.configparser.ConfigParserAdv',
                'configparser.SectionProxy']
 
+def _parser_section(config: Parser, section: Optional[str] = None):
+    """Return the parser and section name of `config`.
+    
+    Args:
+      config: config parser or parser proxy.
+      section: optional; configuration file section (if not a proxy).
+    """
+    if isinstance(config, cparser.SectionProxy):
+        return config.parser, config.name
+    elif section is None:
+        raise ValueError('Section is required if config is not a proxy')
+    else:
+        return config, section
+
 def get_keys(config: Parser, keys: List[str], section: Optional[str] = None,
              fallbacks: Sequence = (None,)) ->  List:
     """Return the values in list of keys.
@@ -21,14 +36,10 @@ def get_keys(config: Parser, keys: List[str], section: Optional[str] = None,
     else:
         pass
 
-    values = []
-    for key, fallback in zip(keys, fallbacks):
-        if section is None:
-            values.append(config.get(key, fallback=fallback))
-        else:
-            values.append(config.get(section, key, fallback=fallback))
+    parser, section = _parser_section(config, section)
 
-    return values
+    return [parser.get(section, key, fallback=fallback)
+            for key, fallback in zip(keys, fallbacks)]
 
 def get_floatkeys(config: Parser, keys: List[str],
                   section: Optional[str] = None,
@@ -75,10 +86,7 @@ def get_boolkeys(config: Parser, keys: List[str],
     else:
         pass
 
-    values = []
-    for key, fallback in zip(keys, fallbacks):
-        if section is None:
-            values.append(config.getboolean(key, fallback=fallback))
-        else:
-            values.append(config.getboolean(section, key, fallback=fallback))
-    return values
+    parser, section = _parser_section(config, section)
+
+    return [parser.getboolean(section, key, fallback=fallback)
+            for key, fallback in zip(keys, fallbacks)]